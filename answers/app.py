@@ -29,8 +29,8 @@ def get_weather():
     limit = args.get('limit', 10)
     bounds_dict = {'offset':offset,'limit':limit}
 
-    where_clause = generate_where_clause([param_1_tup, param_2_tup])
-    pag_dict = get_payload(WX_SCHEMA, WX_TABLE, where_clause, bounds_dict)
+    where_clause, where_params = generate_where_clause([param_1_tup, param_2_tup])
+    pag_dict = get_payload(WX_SCHEMA, WX_TABLE, where_clause, where_params, bounds_dict)
 
     return jsonify({"success": True, "payload": pag_dict})
 
@@ -47,8 +47,8 @@ def get_yield():
     limit = args.get('limit', 10)
     bounds_dict = {'offset': offset, 'limit': limit}
 
-    where_clause = generate_where_clause([param_1_tup])
-    pag_dict = get_payload(YLD_SCHEMA, YLD_TABLE, where_clause, bounds_dict)
+    where_clause, where_params = generate_where_clause([param_1_tup])
+    pag_dict = get_payload(YLD_SCHEMA, YLD_TABLE, where_clause, where_params, bounds_dict)
 
     return jsonify({"success": True, "payload": pag_dict})
 
@@ -66,20 +66,21 @@ def get_weather_stats():
     limit = args.get('limit', 10)
     bounds_dict = {'offset':offset, 'limit':limit}
 
-    where_clause = generate_where_clause([param_1_tup, param_2_tup])
-    pag_dict = get_payload(WX_SCHEMA, AVG_TABLE, where_clause, bounds_dict)
+    where_clause, where_params = generate_where_clause([param_1_tup, param_2_tup])
+    pag_dict = get_payload(WX_SCHEMA, AVG_TABLE, where_clause, where_params, bounds_dict)
 
     return jsonify({"success": True, "payload": pag_dict})
 
 
-def get_payload(schema, table, where_clause, bounds_dict):
+def get_payload(schema, table, where_clause, where_params, bounds_dict):
     """
     Preprocesses pagination structure, queries data
     Returns: String
     """
-    pagination_clause = f" LIMIT {bounds_dict['limit']} OFFSET {bounds_dict['offset']}"
-    ans = get_data(schema, table, where_clause, pagination_clause)
-    count_str = get_data(schema, table, where_clause, '', True)
+    pagination_clause = ' LIMIT %s OFFSET %s'
+    pagination_params = [int(bounds_dict['limit']), int(bounds_dict['offset'])]
+    ans = get_data(schema, table, where_clause, where_params + pagination_params, pagination_clause)
+    count_str = get_data(schema, table, where_clause, where_params, '', True)
     count = count_str[0]['count']
     bounds_dict['count'] = count
 
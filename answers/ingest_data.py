@@ -1,14 +1,13 @@
 import io
 import datetime
 import logging
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice
 
-import numpy as np
-import psycopg2
-import psycopg2.extras
-import pandas as pd
-from psycopg2.extensions import register_adapter, AsIs
-
-from utils import db_connect
+from utils import POOL_SIZE, config, db_connect, db_release
 from pathlib import Path
 import os
 
@@ -22,10 +21,146 @@ YLD_SCHEMA = 'yld_schema'
 WX_TABLE = 'wx_data'
 YLD_TABLE = 'yld_data'
 AVG_TABLE = 'avg_table'
+TOTALS_TABLE = 'avg_totals'
 
 WX_COLS = ['DATE', 'MAX_TEMP_1_10_DEG_C', 'MIN_TEMP_1_10_DEG_C', 'PRECIPITATION_1_10_MM']
 YLD_COLS = ['YEAR', 'TOTAL_CORN_GRAIN_YIELD_MT']
 
+# each COPY holds a pooled connection, so never ask for more than the pool has
+COPY_CONNECTIONS = min(config.getint('ingest', 'COPY_CONNECTIONS', fallback=min(os.cpu_count() or 1, 4)), POOL_SIZE)
+
+# transaction-local settings for bulk loads, no server restart needed
+LOAD_SETTINGS = {
+    'synchronous_commit': 'off',
+    'maintenance_work_mem': '1GB',
+    'work_mem': '256MB',
+}
+
+# framing and date epoch of Postgres binary COPY format
+PG_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PG_COPY_TRAILER = struct.pack('>h', -1)
+PG_EPOCH_ORDINAL = datetime.date(2000, 1, 1).toordinal()
+YLD_ROW = struct.Struct('>hiiii')
+
+
+@lru_cache(maxsize=None)
+def pg_days(date_token):
+    """
+    Converts raw YYYYMMDD token to days since Postgres epoch with integer arithmetic,
+    cached since every station repeats the same dates
+    Returns: int
+    """
+    date_int = int(date_token)
+    return datetime.date(date_int // 10000, date_int // 100 % 100, date_int % 100).toordinal() - PG_EPOCH_ORDINAL
+
+
+def unique_rows(rows):
+    """
+    Drops rows whose key was already seen, key is the first field
+    (DATE within a station file, YEAR for yield), keeps the initial load
+    free of duplicates that would break the primary key rebuild
+    Returns: Generator of tuple
+    """
+    seen = set()
+    for row in rows:
+        if row[0] not in seen:
+            seen.add(row[0])
+            yield row
+
+
+def ingest_data_helper(file, data_dir, data_is_wx):
+    """
+    Reads tab separated file, encodes it as Postgres binary COPY tuples
+    (wx rows get STATION_ID from filename and DATE as days since 2000-01-01)
+    Module level so it can be pickled to worker processes
+    Returns: bytes
+    """
+    # split per line, a malformed line is reported instead of shifting every later row
+    num_fields = 4 if data_is_wx else 2
+    with open(f'{data_dir}/{file}', 'rb') as f:
+        lines = f.read().splitlines()
+    rows = [fields for fields in map(bytes.split, lines) if fields]
+    if any(len(fields) != num_fields for fields in rows):
+        line_num = next(num for num, line in enumerate(lines, 1) if len(line.split()) not in (0, num_fields))
+        raise ValueError(f'{data_dir}/{file}:{line_num}: expected {num_fields} fields per line')
+    rows = unique_rows(rows)
+
+    if data_is_wx:
+        # each tuple is field count, then (length, value) per field
+        station_id = file[:-4].encode()  # file list only holds '.txt' names
+        station_len, pack = len(station_id), struct.Struct(f'>hi{len(station_id)}siiiiiiii').pack
+        tuples = [pack(5, station_len, station_id, 4, pg_days(d), 4, int(max_t), 4, int(min_t), 4, int(prcp))
+                  for d, max_t, min_t, prcp in rows]
+    else:
+        pack = YLD_ROW.pack
+        tuples = [pack(2, 4, int(year), 4, int(total)) for year, total in rows]
+    return b''.join(tuples)
+
+
+def set_load_settings(cur):
+    """
+    Applies LOAD_SETTINGS for the rest of the current transaction only
+    """
+    for name, value in LOAD_SETTINGS.items():
+        cur.execute('SELECT set_config(%s, %s, true)', (name, value))
+
+
+def stream_map(executor, fn, items, window):
+    """
+    Like executor.map, but keeps at most window items in flight so encoded
+    files stream into COPY instead of piling up in memory ahead of it,
+    the first window is submitted right away by the calling thread
+    Returns: Generator
+    """
+    items = iter(items)
+    pending = deque(executor.submit(fn, item) for item in islice(items, window))
+    return _drain_pending(executor, fn, items, pending)
+
+
+def _drain_pending(executor, fn, items, pending):
+    while pending:
+        result = pending.popleft().result()
+        for item in islice(items, 1):
+            pending.append(executor.submit(fn, item))
+        yield result
+
+
+class IterStream(io.RawIOBase):
+    """
+    Read-only file-like wrapper around an iterable of bytes chunks,
+    lets copy_expert pull data lazily instead of from a materialized buffer
+    """
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.chunk = b''
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            # everything up to EOF, as io expects
+            data = b''.join(chain([self.chunk[self.pos:]], self.chunks))
+            self.chunk, self.pos = b'', 0
+            return data
+
+        # serve from the current chunk, only fetch the next one when it is used up
+        while self.pos >= len(self.chunk):
+            self.chunk = next(self.chunks, None)
+            self.pos = 0
+            if self.chunk is None:
+                self.chunk = b''
+                return b''
+        data = self.chunk[self.pos:self.pos + size]
+        self.pos += len(data)
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
 
 class Ingestor():
     def __init__(self, schema, table):
@@ -34,36 +169,162 @@ class Ingestor():
 
     def ingest_data(self, query):
         """
-        Reads data from local dir, ingests into Postgres db
+        Reads data from local dir, streams it into Postgres db
         """
         logging.info('Ingesting data: ' + self.table)
-        data_is_wx = self.table == 'wx_data'
-        keys, data_dir, data_cols = (['FILE', 'DATE'], WX_DATA, WX_COLS) if data_is_wx \
+        data_is_wx = self.table == WX_TABLE
+        keys, data_dir, data_cols = (['STATION_ID', 'DATE'], WX_DATA, ['STATION_ID'] + WX_COLS) if data_is_wx \
             else (['YEAR'], YLD_DATA, YLD_COLS)
 
-        # concatenate all csvs in dir into df
-        file_list = [file for file in os.listdir(data_dir) if file.endswith('.txt')]
-        df = pd.concat([self.ingest_data_helper(file, data_dir, data_cols) for file in file_list])
-        df = df.drop_duplicates(keys)
-
-        # only keep filename for wx_data, rename
-        if data_is_wx:
-            df.rename(columns={'FILE': 'STATION_ID'}, inplace=True)
-            df['DATE'] = pd.to_datetime(df['DATE'].astype(str), format='%Y%m%d')
-        else:
-            df.drop('FILE', axis=1, inplace=True)
+        # encode csvs in dir in parallel, largest first to cut stragglers,
+        # duplicate keys within a file are dropped by unique_rows while encoding
+        with os.scandir(data_dir) as entries:
+            files = [entry for entry in entries if entry.name.endswith('.txt')]
+        file_list = [entry.name for entry in sorted(files, key=lambda entry: entry.stat().st_size, reverse=True)]
+        encode = partial(ingest_data_helper, data_dir=data_dir, data_is_wx=data_is_wx)
 
         self.create_table(self.table, query)
-        self.upload_to_db(df)
-
-    def ingest_data_helper(self, file, data_dir, cols):
+        if data_is_wx:
+            self.generate_avg_table()
+
+        # an interrupted initial load leaves the table without primary key or UNLOGGED,
+        # restore it before ON CONFLICT in the staging path relies on the key again
+        if self.initial_load_interrupted():
+            self.recover_initial_load(keys)
+
+        # loading an empty table skips WAL and primary key upkeep, both are restored afterwards
+        initial_load = self.table_is_empty()
+        if initial_load:
+            self.start_initial_load()
+
+        # deal size-sorted files round-robin over several connections, each COPYs on its own
+        num_shards = max(1, min(COPY_CONNECTIONS, len(file_list)))
+        shards = [file_list[i::num_shards] for i in range(num_shards)]
+        window = max(2, 2 * (os.cpu_count() or 1) // num_shards)
+        try:
+            with ProcessPoolExecutor() as executor:
+                # first submits happen here on the main thread, so worker processes are
+                # started (forked on Linux) before any copier thread runs a COPY
+                streams = [stream_map(executor, encode, shard, window) for shard in shards]
+                with ThreadPoolExecutor(num_shards) as copiers:
+                    uploads = [copiers.submit(self.upload_to_db, stream, data_cols, initial_load)
+                               for stream in streams]
+                    rows_added = sum(upload.result() for upload in uploads)
+        finally:
+            if initial_load:
+                self.finish_initial_load(keys)
+
+        logging.info(f'Rows added: {str(rows_added)}')
+
+    def table_is_empty(self):
+        """
+        Checks if table has no rows
+        Returns: bool
+        """
+        session = db_connect()
+        try:
+            cur = session.cursor()
+            cur.execute(f'SELECT NOT EXISTS (SELECT 1 FROM {self.schema}.{self.table})')
+            empty = cur.fetchone()[0]
+            cur.close()
+        finally:
+            db_release(session)
+        return empty
+
+    def initial_load_interrupted(self):
+        """
+        Checks if table is still UNLOGGED or missing its primary key
+        Returns: bool
+        """
+        session = db_connect()
+        try:
+            cur = session.cursor()
+            cur.execute('''
+            SELECT c.relpersistence = 'u'
+                OR NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conrelid = c.oid AND contype = 'p')
+            FROM pg_class c
+            WHERE c.oid = to_regclass(%s)
+            ''', (f'{self.schema}.{self.table}',))
+            interrupted = cur.fetchone()[0]
+            cur.close()
+        finally:
+            db_release(session)
+        return interrupted
+
+    def recover_initial_load(self, keys):
+        """
+        Drops duplicate keys left by an interrupted initial load, then finishes it
+        """
+        logging.info(f'Recovering interrupted initial load: {self.schema}.{self.table}')
+        session = db_connect()
+        try:
+            cur = session.cursor()
+            self.drop_primary_key(cur)
+            key_match = ' AND '.join(f'a.{key} = b.{key}' for key in keys)
+            cur.execute(f'''
+            DELETE FROM {self.schema}.{self.table} a
+            USING {self.schema}.{self.table} b
+            WHERE a.ctid > b.ctid AND {key_match}
+            ''')
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
+        self.finish_initial_load(keys)
+
+    def start_initial_load(self):
+        """
+        Sets empty table UNLOGGED and drops its primary key before an initial load
+        """
+        logging.info(f'Preparing initial load: {self.schema}.{self.table}')
+        session = db_connect()
+        try:
+            cur = session.cursor()
+            cur.execute(f'ALTER TABLE {self.schema}.{self.table} SET UNLOGGED')
+            self.drop_primary_key(cur)
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
+
+    def drop_primary_key(self, cur):
+        """
+        Drops table primary key by its actual name, looked up in pg_constraint
         """
-        Reads csv as DataFrame, adds FILE col
-        Returns: Pandas DataFrame
+        cur.execute("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+                    (f'{self.schema}.{self.table}',))
+        row = cur.fetchone()
+        if row is not None:
+            conname = row[0].replace('"', '""')
+            cur.execute(f'ALTER TABLE {self.schema}.{self.table} DROP CONSTRAINT "{conname}"')
+
+    def finish_initial_load(self, keys):
         """
-        df = pd.read_csv(f'{data_dir}/{file}', sep='\t', names=cols)
-        df['FILE'] = Path(file).stem
-        return df
+        Sets table back to logged, rebuilds primary key in one pass
+        and computes yearly totals after an initial load
+        """
+        logging.info(f'Finishing initial load: {self.schema}.{self.table}')
+        session = db_connect()
+        try:
+            cur = session.cursor()
+            # committed on its own, so a failed key rebuild cannot leave the table UNLOGGED
+            cur.execute(f'ALTER TABLE {self.schema}.{self.table} SET LOGGED')
+            session.commit()
+            set_load_settings(cur)
+            try:
+                cur.execute(f"ALTER TABLE {self.schema}.{self.table} ADD PRIMARY KEY ({','.join(keys)})")
+            except Exception:
+                logging.error(f'Rebuilding primary key failed: {self.schema}.{self.table}, '
+                              'duplicate keys are dropped on the next run')
+                raise
+            if self.table == WX_TABLE:
+                # every row is new, rebuild yearly totals from the whole table once
+                cur.execute(f'TRUNCATE {self.schema}.{TOTALS_TABLE}')
+                cur.execute(self.fold_totals_query(f'{self.schema}.{self.table}'))
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
 
     def create_table(self, table, query):
         """
@@ -71,99 +332,164 @@ class Ingestor():
         """
         logging.info(f'Creating schema (if not exists): {self.schema}')
         session = db_connect()
-        cur = session.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        try:
+            cur = session.cursor()
 
-        cur.execute(f'CREATE SCHEMA IF NOT EXISTS {self.schema}')
+            cur.execute(f'CREATE SCHEMA IF NOT EXISTS {self.schema}')
 
-        logging.info(f'Creating table (if not exists): {self.schema}.{table}')
+            logging.info(f'Creating table (if not exists): {self.schema}.{table}')
 
-        cur.execute(query)
-        session.commit()
-        cur.close()
-        session.close()
+            cur.execute(query)
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
 
-    def upload_to_db(self, df):
+    def upload_to_db(self, chunks, columns, initial_load=False):
         """
-        Writes df to Postgres db, gets rows added count
+        Copies binary encoded chunks to Postgres db on its own connection,
+        straight into the table on an initial load, else through a staging table
+        Returns: int rows added
         """
         logging.info(f'Writing to table: {self.schema}.{self.table}')
-        psycopg2.extensions.register_adapter(np.int64, psycopg2._psycopg.AsIs)
         session = db_connect()
-        cur = session.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-        cur.execute(f'SELECT COUNT(*) FROM {self.schema}.{self.table}')
-        prev_count = cur.fetchone()['count']
-
-        # store new csv in memory and insert
-        buffer = io.StringIO()
-        df.to_csv(buffer, index=False, date_format='%Y-%m-%d')
-        buffer.seek(0)
-
-        query = f'''
-        BEGIN;
-        CREATE TEMP TABLE tmp_table 
-        (LIKE {self.schema}.{self.table} INCLUDING DEFAULTS)
-        ON COMMIT DROP;
-
-        COPY tmp_table({','.join(df.columns)}) FROM STDOUT CSV HEADER;
-
-        INSERT INTO {self.schema}.{self.table}
-        SELECT *
-        FROM tmp_table
-        ON CONFLICT DO NOTHING;
-        COMMIT;
-        '''
-        cur.copy_expert(query, buffer)
-        session.commit()
-
-        cur.execute(f'SELECT COUNT(*) FROM {self.schema}.{self.table}')
-        new_count = cur.fetchone()['count']
-        logging.info(f'Rows added: {str(new_count - prev_count)}')
-        cur.close()
-        session.close()
+        try:
+            cur = session.cursor()
+            stream = IterStream(chain([PG_COPY_HEADER], chunks, [PG_COPY_TRAILER]))
+
+            # separate statements in one transaction, so rowcount reflects the COPY or INSERT
+            set_load_settings(cur)
+            if initial_load:
+                cur.copy_expert(f"COPY {self.schema}.{self.table}({','.join(columns)}) "
+                                "FROM STDIN WITH (FORMAT binary)", stream)
+                rows_added = cur.rowcount
+            else:
+                cur.execute(f'''
+                CREATE TEMP TABLE tmp_table
+                (LIKE {self.schema}.{self.table} INCLUDING DEFAULTS)
+                ON COMMIT DROP;
+                ''')
+                # tmp_table is created in this transaction, so rows can be written pre-frozen
+                cur.copy_expert(f"COPY tmp_table({','.join(columns)}) FROM STDIN WITH (FORMAT binary, FREEZE)",
+                                stream)
+                insert_query = f'''
+                INSERT INTO {self.schema}.{self.table}
+                SELECT *
+                FROM tmp_table
+                ON CONFLICT DO NOTHING
+                '''
+                if self.table == WX_TABLE:
+                    # only rows that were actually inserted are folded into the yearly totals
+                    cur.execute(f'''
+                    WITH inserted AS ({insert_query} RETURNING *),
+                    folded AS ({self.fold_totals_query('inserted')})
+                    SELECT COUNT(*) FROM inserted;
+                    ''')
+                    rows_added = cur.fetchone()[0]
+                else:
+                    cur.execute(insert_query)
+                    rows_added = cur.rowcount
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
+        return rows_added
 
     def generate_avg_table(self):
         """
-        Creates average table, fills with filtered data
+        Creates yearly totals table and averages view on top of it if not exists,
+        replacing an averages base table from older installs and backfilling
+        totals from already loaded weather data, upload_to_db keeps them up to date
         """
         logging.info('Creating averages table (if not exists)')
+        session = db_connect()
+        try:
+            cur = session.cursor()
+            cur.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)',
+                        (f'{self.schema}.{AVG_TABLE}',))
+            row = cur.fetchone()
+            if row is not None and row[0] != 'v':
+                # older installs stored averages as a table, the view takes its place
+                logging.info(f'Dropping averages base table: {self.schema}.{AVG_TABLE}')
+                cur.execute(f'DROP TABLE {self.schema}.{AVG_TABLE}')
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
 
         query = f'''
-        CREATE TABLE IF NOT EXISTS {self.schema}.{AVG_TABLE}(
+        CREATE TABLE IF NOT EXISTS {self.schema}.{TOTALS_TABLE}(
             STATION_ID VARCHAR(20),
             YEAR int4,
-            AVG_MAX_TEMP int4,
-            AVG_MIN_TEMP int4,
-            TOTAL_PRECIPITATION int4,
+            SUM_MAX_TEMP int8,
+            COUNT_MAX_TEMP int4,
+            SUM_MIN_TEMP int8,
+            COUNT_MIN_TEMP int4,
+            SUM_PRECIPITATION int8,
+            COUNT_PRECIPITATION int4,
             PRIMARY KEY(STATION_ID,YEAR)
         );
+
+        CREATE OR REPLACE VIEW {self.schema}.{AVG_TABLE} AS
+        SELECT
+            STATION_ID,
+            YEAR,
+            (SUM_MAX_TEMP::numeric / NULLIF(COUNT_MAX_TEMP, 0) / 10)::int4 AS AVG_MAX_TEMP,
+            (SUM_MIN_TEMP::numeric / NULLIF(COUNT_MIN_TEMP, 0) / 10)::int4 AS AVG_MIN_TEMP,
+            (CASE WHEN COUNT_PRECIPITATION > 0 THEN SUM_PRECIPITATION / 100 END)::int4 AS TOTAL_PRECIPITATION
+        FROM
+            {self.schema}.{TOTALS_TABLE};
         '''
-        self.create_table(AVG_TABLE, query)
+        self.create_table(TOTALS_TABLE, query)
 
-        logging.info('Writing to averages table')
+        # staging loads only fold newly inserted rows, so totals missing for
+        # rows loaded before they existed have to be computed once here
         session = db_connect()
-        cur = session.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-        query = f'''
-        INSERT INTO {self.schema}.{AVG_TABLE}
-        (STATION_ID, YEAR, AVG_MAX_TEMP, AVG_MIN_TEMP, TOTAL_PRECIPITATION)
+        try:
+            cur = session.cursor()
+            cur.execute(f'''
+            SELECT NOT EXISTS (SELECT 1 FROM {self.schema}.{TOTALS_TABLE})
+                AND EXISTS (SELECT 1 FROM {self.schema}.{WX_TABLE})
+            ''')
+            if cur.fetchone()[0]:
+                logging.info(f'Backfilling averages from: {self.schema}.{WX_TABLE}')
+                set_load_settings(cur)
+                cur.execute(self.fold_totals_query(f'{self.schema}.{WX_TABLE}'))
+            session.commit()
+            cur.close()
+        finally:
+            db_release(session)
+
+    def fold_totals_query(self, source):
+        """
+        Builds upsert adding per station, per year sums and counts of source rows
+        to the yearly totals, missing values are ignored
+        Returns: String
+        """
+        return f'''
+        INSERT INTO {self.schema}.{TOTALS_TABLE} AS totals
         SELECT
             STATION_ID,
             EXTRACT(YEAR FROM DATE) as YYYY,
-            AVG(MAX_TEMP_1_10_DEG_C) FILTER (WHERE MAX_TEMP_1_10_DEG_C <> -9999) / 10,
-            AVG(MIN_TEMP_1_10_DEG_C) FILTER (WHERE MIN_TEMP_1_10_DEG_C <> -9999) / 10,
-            SUM(PRECIPITATION_1_10_mm) FILTER (WHERE PRECIPITATION_1_10_mm <> -9999) / 100
+            COALESCE(SUM(MAX_TEMP_1_10_DEG_C) FILTER (WHERE MAX_TEMP_1_10_DEG_C <> -9999), 0),
+            COUNT(*) FILTER (WHERE MAX_TEMP_1_10_DEG_C <> -9999),
+            COALESCE(SUM(MIN_TEMP_1_10_DEG_C) FILTER (WHERE MIN_TEMP_1_10_DEG_C <> -9999), 0),
+            COUNT(*) FILTER (WHERE MIN_TEMP_1_10_DEG_C <> -9999),
+            COALESCE(SUM(PRECIPITATION_1_10_mm) FILTER (WHERE PRECIPITATION_1_10_mm <> -9999), 0),
+            COUNT(*) FILTER (WHERE PRECIPITATION_1_10_mm <> -9999)
         FROM
-            {self.schema}.{self.table}
+            {source}
         GROUP BY
             STATION_ID,
             EXTRACT(YEAR FROM DATE)
-        ON CONFLICT DO NOTHING;
+        ON CONFLICT (STATION_ID, YEAR) DO UPDATE SET
+            SUM_MAX_TEMP = totals.SUM_MAX_TEMP + EXCLUDED.SUM_MAX_TEMP,
+            COUNT_MAX_TEMP = totals.COUNT_MAX_TEMP + EXCLUDED.COUNT_MAX_TEMP,
+            SUM_MIN_TEMP = totals.SUM_MIN_TEMP + EXCLUDED.SUM_MIN_TEMP,
+            COUNT_MIN_TEMP = totals.COUNT_MIN_TEMP + EXCLUDED.COUNT_MIN_TEMP,
+            SUM_PRECIPITATION = totals.SUM_PRECIPITATION + EXCLUDED.SUM_PRECIPITATION,
+            COUNT_PRECIPITATION = totals.COUNT_PRECIPITATION + EXCLUDED.COUNT_PRECIPITATION
         '''
-        cur.execute(query)
-        session.commit()
-        cur.close()
-        session.close()
 
 
 if __name__ == '__main__':
@@ -203,10 +529,4 @@ if __name__ == '__main__':
     logging.info(f"Completed ingesting yield data at {datetime.datetime.now()}")
     logging.info(f"Total time to ingest yield data {datetime.datetime.now() - start_time}")
 
-    start_time = datetime.datetime.now()
-    logging.info(f"Starting to compute averages {start_time}")
-    Ingestion_Obj_WX.generate_avg_table()
-    logging.info(f"Completed computing averages at {datetime.datetime.now()}")
-    logging.info(f"Total time to computer averages {datetime.datetime.now() - start_time}")
-
     logging.info("Ingestion of data is complete")
\ No newline at end of file
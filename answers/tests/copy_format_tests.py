@@ -0,0 +1,116 @@
+import io
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(os.path.abspath(__file__)).parents[1]))
+
+from ingest_data import IterStream, PG_COPY_HEADER, PG_COPY_TRAILER, ingest_data_helper, pg_days, unique_rows
+
+
+def decode_copy_tuples(data):
+    """
+    Decodes Postgres binary COPY tuples, independent of the encoder
+    Returns: list of tuples of raw field bytes
+    """
+    rows, pos = [], 0
+    while pos < len(data):
+        (num_fields,) = struct.unpack_from('>h', data, pos)
+        pos += 2
+        fields = []
+        for _ in range(num_fields):
+            (length,) = struct.unpack_from('>i', data, pos)
+            pos += 4
+            fields.append(data[pos:pos + length])
+            pos += length
+        rows.append(tuple(fields))
+    return rows
+
+
+def int4(field):
+    return struct.unpack('>i', field)[0]
+
+
+class CopyFormatTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.data_dir)
+
+    def write_file(self, name, text):
+        with open(f'{self.data_dir}/{name}', 'w') as f:
+            f.write(text)
+
+    def test_pg_days(self):
+        self.assertEqual(pg_days(b'20000101'), 0)
+        self.assertEqual(pg_days(b'19850101'), -5478)
+        self.assertEqual(pg_days(b'20141231'), 5478)
+        self.assertEqual(pg_days(b'20000301'), 60)
+
+    def test_unique_rows_keeps_first(self):
+        rows = [(b'1985', b'1'), (b'1986', b'2'), (b'1985', b'3')]
+        self.assertEqual(list(unique_rows(rows)), [(b'1985', b'1'), (b'1986', b'2')])
+
+    def test_wx_tuples(self):
+        self.write_file('USC00110072.txt',
+                        '19850101\t  -22\t -128\t   94\n'
+                        '\n'
+                        '19850102\t -122\t -217\t-9999\n'
+                        '19850101\t    5\t    5\t    5\n')
+        rows = decode_copy_tuples(ingest_data_helper('USC00110072.txt', self.data_dir, True))
+
+        self.assertEqual(len(rows), 2)
+        station_id, date, max_t, min_t, prcp = rows[0]
+        self.assertEqual(station_id, b'USC00110072')
+        self.assertEqual((int4(date), int4(max_t), int4(min_t), int4(prcp)), (-5478, -22, -128, 94))
+        self.assertEqual([int4(field) for field in rows[1][1:]], [-5477, -122, -217, -9999])
+
+    def test_yld_tuples(self):
+        self.write_file('US_corn_grain_yield.txt', '1985\t225447\n1986\t208944\n')
+        rows = decode_copy_tuples(ingest_data_helper('US_corn_grain_yield.txt', self.data_dir, False))
+        self.assertEqual([[int4(field) for field in row] for row in rows], [[1985, 225447], [1986, 208944]])
+
+    def test_malformed_line_raises(self):
+        self.write_file('US_corn_grain_yield.txt', '1985\t225447\n1986\n1987\t181143\n')
+        with self.assertRaisesRegex(ValueError, 'US_corn_grain_yield.txt:2'):
+            ingest_data_helper('US_corn_grain_yield.txt', self.data_dir, False)
+
+    def test_stream_framing(self):
+        self.write_file('US_corn_grain_yield.txt', '1985\t225447\n')
+        body = ingest_data_helper('US_corn_grain_yield.txt', self.data_dir, False)
+        data = IterStream([PG_COPY_HEADER, body, PG_COPY_TRAILER]).read()
+
+        self.assertTrue(data.startswith(b'PGCOPY\n\xff\r\n\x00'))
+        self.assertEqual(len(PG_COPY_HEADER), 19)
+        self.assertTrue(data.endswith(b'\xff\xff'))
+        self.assertEqual(decode_copy_tuples(data[len(PG_COPY_HEADER):-len(PG_COPY_TRAILER)]),
+                         decode_copy_tuples(body))
+
+    def test_stream_chunk_boundaries(self):
+        chunks = [b'abc', b'', b'defgh', b'i']
+        for size in (1, 2, 3, 4, 100):
+            stream = IterStream(chunks)
+            parts = []
+            while chunk := stream.read(size):
+                self.assertLessEqual(len(chunk), size)
+                parts.append(chunk)
+            self.assertEqual(b''.join(parts), b'abcdefghi')
+            self.assertEqual(stream.read(size), b'')
+
+    def test_stream_read_all(self):
+        chunks = [b'abc', b'', b'defgh', b'i']
+        stream = IterStream(chunks)
+        self.assertEqual(stream.read(2), b'ab')
+        self.assertEqual(stream.read(), b'cdefghi')
+        self.assertEqual(stream.read(), b'')
+        self.assertEqual(IterStream(chunks).readall(), b'abcdefghi')
+        self.assertEqual(io.BufferedReader(IterStream(chunks), buffer_size=2).read(), b'abcdefghi')
+
+
+if __name__ == '__main__':
+    unittest.main()
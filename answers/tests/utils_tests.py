@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(os.path.abspath(__file__)).parents[1]))
+
+import utils
+from utils import generate_where_clause
+
+
+class WhereClauseTestCase(unittest.TestCase):
+    def test_no_filters(self):
+        self.assertEqual(generate_where_clause([]), ('', []))
+        self.assertEqual(generate_where_clause([('station_id', None), ('date', None)]), ('', []))
+
+    def test_one_filter(self):
+        self.assertEqual(generate_where_clause([('year', '2000')]), (' WHERE year = %s', ['2000']))
+
+    def test_two_filters_keep_order(self):
+        where_clause, params = generate_where_clause([('station_id', 'USC00110072'), ('date', '1996-01-01')])
+        self.assertEqual(where_clause, ' WHERE station_id = %s AND date = %s')
+        self.assertEqual(params, ['USC00110072', '1996-01-01'])
+
+    def test_none_value_dropped(self):
+        self.assertEqual(generate_where_clause([('station_id', None), ('year', '1987')]),
+                         (' WHERE year = %s', ['1987']))
+
+    def test_values_not_interpolated(self):
+        where_clause, params = generate_where_clause([('date', "1996-01-01' OR '1'='1")])
+        self.assertEqual(where_clause, ' WHERE date = %s')
+        self.assertEqual(params, ["1996-01-01' OR '1'='1"])
+
+
+class CountCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        utils._get_cached_data.cache_clear()
+        patcher = mock.patch.object(utils, '_get_data', return_value=[{'count': 5}])
+        self.get_data = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(utils._get_cached_data.cache_clear)
+
+    def count(self, params):
+        return utils.get_data('wx_schema', 'wx_data', ' WHERE date = %s', params, '', True)
+
+    @mock.patch.object(utils, 'COUNT_CACHE_TTL', 30)
+    @mock.patch('utils.time.monotonic', return_value=100.0)
+    def test_same_query_hits_cache(self, _):
+        self.assertEqual(self.count(['1996-01-01']), [{'count': 5}])
+        self.assertEqual(self.count(['1996-01-01']), [{'count': 5}])
+        self.assertEqual(self.get_data.call_count, 1)
+
+    @mock.patch.object(utils, 'COUNT_CACHE_TTL', 30)
+    @mock.patch('utils.time.monotonic', return_value=100.0)
+    def test_different_params_miss(self, _):
+        self.count(['1996-01-01'])
+        self.count(['1997-01-01'])
+        self.assertEqual(self.get_data.call_count, 2)
+
+    @mock.patch.object(utils, 'COUNT_CACHE_TTL', 30)
+    def test_new_ttl_bucket_misses(self):
+        with mock.patch('utils.time.monotonic', return_value=100.0):
+            self.count(['1996-01-01'])
+        with mock.patch('utils.time.monotonic', return_value=119.0):
+            self.count(['1996-01-01'])
+        self.assertEqual(self.get_data.call_count, 1)
+        with mock.patch('utils.time.monotonic', return_value=120.0):
+            self.count(['1996-01-01'])
+        self.assertEqual(self.get_data.call_count, 2)
+
+    @mock.patch.object(utils, 'COUNT_CACHE_TTL', 0)
+    def test_zero_ttl_bypasses_cache(self):
+        self.count(['1996-01-01'])
+        self.count(['1996-01-01'])
+        self.assertEqual(self.get_data.call_count, 2)
+
+    @mock.patch.object(utils, 'COUNT_CACHE_TTL', 30)
+    def test_rows_never_cached(self):
+        utils.get_data('wx_schema', 'wx_data', '', [], ' LIMIT %s OFFSET %s')
+        utils.get_data('wx_schema', 'wx_data', '', [], ' LIMIT %s OFFSET %s')
+        self.assertEqual(self.get_data.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
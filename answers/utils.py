@@ -1,41 +1,83 @@
 import configparser
+import threading
+import time
+from functools import lru_cache
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 
 config = configparser.ConfigParser()
 config.read('config.ini')
 
 
+COUNT_CACHE_TTL = config.getint('api', 'COUNT_CACHE_TTL', fallback=30)
+
+POOL_SIZE = config.getint('database', 'POOL_SIZE', fallback=16)
+
+# created on first use, so ingest worker processes importing this module don't connect
+_pool = None
+_pool_lock = threading.Lock()
+# getconn raises instead of waiting when the pool is exhausted, callers wait here instead
+_pool_slots = threading.BoundedSemaphore(POOL_SIZE)
+
+
 def db_connect():
-    pg_conn = psycopg2.connect(user=config['database']['USERNAME'], \
-        password=config['database']['PASSWORD'], host=config['database']['HOST'], \
-        port=config['database']['PORT'], dbname=config['database']['DATABASE'])
-    return pg_conn
+    global _pool
+    _pool_slots.acquire()
+    try:
+        with _pool_lock:
+            if _pool is None:
+                _pool = psycopg2.pool.ThreadedConnectionPool(1, POOL_SIZE, user=config['database']['USERNAME'], \
+                    password=config['database']['PASSWORD'], host=config['database']['HOST'], \
+                    port=config['database']['PORT'], dbname=config['database']['DATABASE'])
+        return _pool.getconn()
+    except Exception:
+        _pool_slots.release()
+        raise
+
+
+def db_release(pg_conn):
+    try:
+        _pool.putconn(pg_conn)
+    finally:
+        _pool_slots.release()
 
 
 def generate_where_clause(where_lst):
     where_lst = [x for x in where_lst if x[1] is not None]
 
-    # adjusts query based on num of params
+    # adjusts query based on num of params, values are passed separately as query params
     if len(where_lst) == 0:
-        return str()
-    str_temp = f" WHERE {where_lst[0][0]} = '{where_lst[0][1]}'"
-    if len(where_lst) == 1:
-        return str_temp
-    return str_temp + f" AND {where_lst[1][0]} = '{where_lst[1][1]}'"
+        return str(), []
+    where_clause = ' WHERE ' + ' AND '.join(f'{col} = %s' for col, _ in where_lst)
+    return where_clause, [val for _, val in where_lst]
 
 
-def get_data(schema,table,where_clause,pagination_clause,count=False):
+def get_data(schema,table,where_clause,params,pagination_clause,count=False):
     selection = '*'
     if count:
         selection = 'COUNT(*)'
-    session = db_connect()
-    cur = session.cursor(cursor_factory = psycopg2.extras.RealDictCursor)
     query = f'''SELECT {selection} FROM {schema}.{table}{where_clause}{pagination_clause};'''
-    cur.execute(query)
-    res = cur.fetchall()
+    if count and COUNT_CACHE_TTL > 0:
+        # every page of a filter asks for the same count, reuse it until the TTL bucket rolls over;
+        # ingest runs in another process, so the TTL is the only bound on staleness
+        return _get_cached_data(query, tuple(params), int(time.monotonic() // COUNT_CACHE_TTL))
+    return _get_data(query, params)
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_data(query, params, ttl_bucket):
+    return _get_data(query, params)
 
-    cur.close()
-    session.close()
+
+def _get_data(query, params):
+    session = db_connect()
+    try:
+        cur = session.cursor(cursor_factory = psycopg2.extras.RealDictCursor)
+        cur.execute(query, params)
+        res = cur.fetchall()
+        cur.close()
+    finally:
+        db_release(session)
     return res